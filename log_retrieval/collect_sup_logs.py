@@ -17,10 +17,14 @@ Usage:
 """
 
 import argparse
+import errno
+import hashlib
 import json
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -33,6 +37,12 @@ except ImportError as e:
     print(f"ERROR: Missing dependency: {e}. Run: pip install duckdb")
     sys.exit(1)
 
+# Optional: faster JSON encoding/decoding (pip install orjson); falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ============================================================================
 # Output helpers (child-mode awareness for PHASE.py pipeline)
@@ -71,8 +81,26 @@ def _out(msg=""):
 BASE_OUTPUT_DIR = Path("/mnt/AXES2U1/SUP_LOGS")
 DEPLOYMENTS_DIR = Path("/home/ubuntu/RUSE/deployments")
 PHASE_EXPERIMENTS_FILE = Path("/mnt/AXES2U1/experiments.json")
+LOCAL_BUILD_DIR = Path("/tmp")
+NFS_IO_BUFSIZE = 2 << 20  # 2 MiB: batch writes to /mnt into large NFS RPCs
 REMOTE_LOG_BASE = "/opt/ruse/deployed_sups"
-SSH_OPTIONS = "-o StrictHostKeyChecking=no -o UserKnownHostsFile=/dev/null -o ConnectTimeout=30 -o BatchMode=yes -o IdentitiesOnly=yes -i ~/.ssh/id_ed25519"
+# argv list, run with shell=False: one exec per call and no local shell quoting.
+# ControlMaster: every ssh call to a VM after the first reuses one authenticated
+# connection instead of paying a fresh TCP + key exchange + auth. Compression is
+# negotiated once for the master connection, so it has to be set here rather
+# than on the cat stream, which only reuses the master.
+SSH_OPTIONS = [
+    "-o", "StrictHostKeyChecking=no",
+    "-o", "UserKnownHostsFile=/dev/null",
+    "-o", "ConnectTimeout=30",
+    "-o", "BatchMode=yes",
+    "-o", "IdentitiesOnly=yes",
+    "-i", os.path.expanduser("~/.ssh/id_ed25519"),
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPath=~/.ssh/cm-%C",
+    "-o", "ControlPersist=120s",
+    "-o", "Compression=yes",  # JSONL compresses well
+]
 SSH_USER = "ubuntu"
 
 
@@ -102,8 +130,8 @@ def load_experiment_configs(phase_config: Path) -> dict:
         return {}
 
     try:
-        with open(phase_config) as f:
-            data = json.load(f)
+        raw = phase_config.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:
         return {}
 
@@ -156,6 +184,7 @@ class CollectionResult:
     events_collected: int = 0
     errors: List[str] = field(default_factory=list)
     success: bool = False
+    unchanged: bool = False  # remote logs identical to the last fetch; transfer skipped
 
 
 # ============================================================================
@@ -195,15 +224,30 @@ CREATE TABLE IF NOT EXISTS events (
 );
 """
 
-CREATE_INDEXES = """
-CREATE INDEX IF NOT EXISTS idx_events_experiment ON events(experiment_name);
-CREATE INDEX IF NOT EXISTS idx_events_event_type ON events(event_type);
-CREATE INDEX IF NOT EXISTS idx_events_agent_type ON events(agent_type);
-CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events(timestamp);
-CREATE INDEX IF NOT EXISTS idx_events_session ON events(session_id);
-CREATE INDEX IF NOT EXISTS idx_events_workflow ON events(workflow);
-CREATE INDEX IF NOT EXISTS idx_events_sup_behavior ON events(sup_behavior);
-CREATE INDEX IF NOT EXISTS idx_events_category ON events(category);
+# Workflow category keywords, matched in order against lower(workflow); first
+# hit wins. Each category's keywords become one regex alternation.
+WORKFLOW_CATEGORIES = [
+    ("web_search", ["search", "google"]),
+    ("youtube", ["youtube", "video"]),
+    ("file_ops", ["download", "file"]),
+    ("shell", ["command", "shell"]),
+    ("document", ["document", "writer", "spreadsheet"]),
+    ("research", ["weather", "explain", "what is"]),
+    ("web_browse", ["browse", "visit", "wikipedia"]),
+]
+
+# No secondary indexes: DuckDB's per-row-group min/max zonemaps already prune
+# the analytical filters/GROUP BYs, and ART indexes only slow the bulk load.
+# Databases built before this change still carry them; drop on --append.
+DROP_LEGACY_INDEXES = """
+DROP INDEX IF EXISTS idx_events_experiment;
+DROP INDEX IF EXISTS idx_events_event_type;
+DROP INDEX IF EXISTS idx_events_agent_type;
+DROP INDEX IF EXISTS idx_events_timestamp;
+DROP INDEX IF EXISTS idx_events_session;
+DROP INDEX IF EXISTS idx_events_workflow;
+DROP INDEX IF EXISTS idx_events_sup_behavior;
+DROP INDEX IF EXISTS idx_events_category;
 """
 
 
@@ -218,22 +262,26 @@ def discover_runs(deployments_dir: Path) -> List[Tuple[str, str, Path]]:
     For legacy layouts (root inventory.ini), run_id is empty string.
     """
     runs = []
-    for path in deployments_dir.iterdir():
-        if not path.is_dir() or path.name in ("playbooks", "lib", "logs"):
-            continue
-
-        # Check for legacy root inventory
-        inv = path / "inventory.ini"
-        if inv.exists():
-            runs.append((path.name, "", inv))
-
-        # Check for multi-run inventories in runs/ subdirs
-        runs_dir = path / "runs"
-        if runs_dir.is_dir():
-            for run_dir in sorted(runs_dir.iterdir()):
-                inv = run_dir / "inventory.ini"
-                if run_dir.is_dir() and inv.exists():
-                    runs.append((path.name, run_dir.name, inv))
+    # scandir reuses dirent types, so non-directories cost no extra stat
+    with os.scandir(deployments_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir() or entry.name in ("playbooks", "lib", "logs"):
+                continue
+            path = Path(entry.path)
+
+            # Check for legacy root inventory
+            inv = path / "inventory.ini"
+            if inv.exists():
+                runs.append((entry.name, "", inv))
+
+            # Check for multi-run inventories in runs/ subdirs
+            runs_dir = path / "runs"
+            if runs_dir.is_dir():
+                with os.scandir(runs_dir) as run_entries:
+                    for run_entry in run_entries:
+                        inv = Path(run_entry.path) / "inventory.ini"
+                        if run_entry.is_dir() and inv.exists():
+                            runs.append((entry.name, run_entry.name, inv))
 
     return sorted(runs)
 
@@ -322,52 +370,104 @@ def collect_logs_from_vm(
 
     remote_log_dir = f"{REMOTE_LOG_BASE}/{vm.sup_behavior}/logs/"
 
+    # One remote, pre-filtered, pre-statted listing of the session files
+    # ("size mtime path" per line). find walks the directory itself, so there
+    # is no shell-glob argv limit however many sessions a SUP has written.
+    list_cmd = [
+        "ssh", *SSH_OPTIONS, f"{SSH_USER}@{vm.ip}",
+        f"find {remote_log_dir} -maxdepth 1 -type f -name '*.jsonl' ! -name 'latest.jsonl' "
+        f"-printf '%s %T@ %p\\n'",
+    ]
+    try:
+        proc = subprocess.run(list_cmd, capture_output=True, text=True, timeout=120)
+    except Exception as e:
+        if dry_run:
+            result.success = True
+        else:
+            result.errors.append(str(e))
+        return result
+    if proc.returncode != 0:
+        stderr = proc.stderr.strip()
+        if dry_run or "No such file" in stderr:
+            result.success = True  # No logs dir is not an error
+        else:
+            result.errors.append(f"ssh list failed (rc={proc.returncode}): {stderr}")
+        return result
+
+    listing = sorted(line for line in proc.stdout.splitlines() if line.strip())
     if dry_run:
-        cmd = f"ssh {SSH_OPTIONS} {SSH_USER}@{vm.ip} 'ls -1 {remote_log_dir}*.jsonl 2>/dev/null || echo \"\"'"
-        try:
-            proc = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=60)
-            if proc.returncode != 0:
-                result.success = True  # No logs dir is not an error
-                return result
-            remote_files = [
-                f for f in proc.stdout.strip().split('\n')
-                if f.strip() and f.endswith('.jsonl') and 'latest.jsonl' not in f
-            ]
-            result.events_collected = len(remote_files)  # approximate: 1 session file ≈ many events
-        except (subprocess.TimeoutExpired, Exception):
-            pass
+        result.events_collected = len(listing)  # approximate: 1 session file ≈ many events
         result.success = True
         return result
 
     # Create output directory
     vm_output_dir = output_dir / experiment / vm.hostname
     vm_output_dir.mkdir(parents=True, exist_ok=True)
+    out_file = vm_output_dir / "events.jsonl"
+    stamp_file = vm_output_dir / "events.jsonl.stamp"
+
+    if not listing:
+        out_file.unlink(missing_ok=True)
+        stamp_file.unlink(missing_ok=True)
+        result.success = True
+        return result
+
+    # Incremental: if the listing matches the stamp left by the last fetch
+    # into this raw dir, the combined file is already current and the
+    # transfer is skipped.
+    signature = hashlib.sha1("\n".join(listing).encode()).hexdigest()
+    if out_file.exists() and stamp_file.exists():
+        try:
+            stamp = json.loads(stamp_file.read_text())
+        except (OSError, ValueError):
+            stamp = {}
+        if stamp.get("signature") == signature:
+            result.events_collected = stamp.get("events", 0)
+            result.unchanged = True
+            result.success = True
+            return result
+    stamp_file.unlink(missing_ok=True)
 
     # Single SSH, single stream: concatenate all JSONL on remote, write one file to NFS.
     # Identical path for 5 files or 22K files — no per-file overhead on either end.
-    out_file = vm_output_dir / "events.jsonl"
-    cat_cmd = (
-        f'ssh {SSH_OPTIONS} {SSH_USER}@{vm.ip} '
-        f'"find {remote_log_dir} -maxdepth 1 -name \'*.jsonl\' ! -name \'latest.jsonl\' -print0 '
-        f'| xargs -0 cat 2>/dev/null" '
-        f'> {out_file}'
-    )
-
+    # ssh compresses the stream in flight (Compression=yes in SSH_OPTIONS).
+    cat_cmd = [
+        "ssh", *SSH_OPTIONS, f"{SSH_USER}@{vm.ip}",
+        f"find {remote_log_dir} -maxdepth 1 -type f -name '*.jsonl' ! -name 'latest.jsonl' -print0 "
+        f"| xargs -0 cat 2>/dev/null",
+    ]
+
+    # Relay the stream through 2 MiB buffered writes instead of handing ssh the
+    # NFS file descriptor (which writes in small pipe-sized pieces), counting
+    # events with bytes.count on the way so the file isn't read back. stderr
+    # goes to a temp file so a chatty remote can't fill its pipe and stall
+    # stdout while nothing is reading it.
     try:
-        proc = subprocess.run(
-            cat_cmd, shell=True, capture_output=True, text=True
-        )
-        if proc.returncode == 0 and out_file.exists() and out_file.stat().st_size > 0:
-            # Count events (lines) in the combined file
-            with open(out_file) as f:
-                result.events_collected = sum(1 for _ in f)
+        lines = 0
+        last = b'\n'
+        with open(out_file, 'wb', buffering=NFS_IO_BUFSIZE) as out, \
+                tempfile.TemporaryFile() as err, \
+                subprocess.Popen(cat_cmd, stdout=subprocess.PIPE, stderr=err) as proc:
+            while chunk := proc.stdout.read(1 << 20):
+                out.write(chunk)
+                lines += chunk.count(b'\n')
+                last = chunk[-1:]
+            proc.wait()
+            err.seek(0)
+            stderr = err.read().decode(errors='replace').strip()
+        if last != b'\n':
+            lines += 1
+        if proc.returncode == 0 and lines > 0:
+            result.events_collected = lines
             result.success = True
+            stamp_file.write_text(json.dumps(
+                {"signature": signature, "events": result.events_collected}
+            ))
         elif proc.returncode == 0:
             out_file.unlink(missing_ok=True)
             result.success = True
         else:
             out_file.unlink(missing_ok=True)
-            stderr = proc.stderr.strip()
             if "No such file" in stderr or "No match" in stderr:
                 result.success = True
             else:
@@ -380,6 +480,24 @@ def collect_logs_from_vm(
     return result
 
 
+def close_control_masters(vms: List[VMInfo]) -> None:
+    """Shut down the ssh ControlMaster connections opened during collection.
+
+    The control socket is shared by every collector on this host, so use
+    "-O stop": the master takes no new sessions but lets any still running
+    (e.g. another run's cat stream) finish before it exits.
+    """
+    for ip in sorted(set(vm.ip for vm in vms)):
+        try:
+            subprocess.run(
+                ["ssh", *SSH_OPTIONS, "-O", "stop", f"{SSH_USER}@{ip}"],
+                capture_output=True, text=True, timeout=10
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            # Best effort: ControlPersist reaps a stuck master on its own
+            continue
+
+
 # ============================================================================
 # DuckDB Operations
 # ============================================================================
@@ -387,8 +505,14 @@ def collect_logs_from_vm(
 def init_database(db_path: Path) -> duckdb.DuckDBPyConnection:
     """Initialize DuckDB database with schema."""
     conn = duckdb.connect(str(db_path))
+    # Bulk-load settings. Insertion order only matters where the INSERT says
+    # so: its ORDER BY (experiment, behavior, timestamp) still clusters rows
+    # for the zonemaps, and the rest can run in parallel. threads/memory_limit
+    # stay at DuckDB's defaults (all cores, 80% of RAM), and spill goes to
+    # {db}.tmp, which is on local disk because the build is.
+    conn.execute("SET preserve_insertion_order = false")
     conn.execute(CREATE_EVENTS_TABLE)
-    conn.execute(CREATE_INDEXES)
+    conn.execute(DROP_LEGACY_INDEXES)
     return conn
 
 
@@ -398,9 +522,64 @@ def load_events_to_duckdb(
     experiments: List[str],
     vm_info_map: Dict[str, VMInfo]
 ) -> int:
-    """Load JSONL events into DuckDB using native JSON reader."""
+    """Load JSONL events into DuckDB using native JSON reader.
+
+    All collected files go through a single read_json scan, joined to a
+    per-file VM metadata table, so the whole collection is parsed in one
+    vectorized pass instead of one INSERT per VM.
+    """
     collection_ts = datetime.now().isoformat()
-    total_loaded = 0
+
+    # Per-file VM metadata, matched to rows via read_json's filename column.
+    # scandir reuses the dirent type, avoiding a stat per entry on NFS; order
+    # doesn't matter since IDs are assigned by the INSERT.
+    file_meta = []
+    for experiment in experiments:
+        exp_dir = raw_dir / experiment
+        if not exp_dir.is_dir():
+            continue
+
+        with os.scandir(exp_dir) as vm_entries:
+            for vm_entry in vm_entries:
+                if not vm_entry.is_dir():
+                    continue
+
+                vm = vm_info_map.get(f"{experiment}:{vm_entry.name}")
+                with os.scandir(vm_entry.path) as entries:
+                    for entry in entries:
+                        if (not entry.name.endswith(".jsonl") or entry.name == "latest.jsonl"
+                                or entry.is_symlink()):
+                            continue
+                        file_meta.append((
+                            entry.path,
+                            experiment,
+                            vm_entry.name,
+                            vm.ip if vm else "",
+                            vm.sup_behavior if vm else "",
+                            vm.sup_flavor if vm else "",
+                        ))
+
+    if not file_meta:
+        if not _CHILD_MODE:
+            print("  Total: 0 events")
+        return 0
+
+    # Hand the metadata over column-wise as list parameters: one statement
+    # builds the table, instead of an executemany round-trip per file.
+    file_columns = dict(zip(
+        ("filename", "experiment_name", "vm_hostname", "vm_ip", "sup_behavior", "sup_flavor"),
+        map(list, zip(*file_meta)),
+    ))
+    conn.execute("""
+        CREATE OR REPLACE TEMP TABLE file_meta AS
+        SELECT
+            unnest($filename::VARCHAR[])        as filename,
+            unnest($experiment_name::VARCHAR[]) as experiment_name,
+            unnest($vm_hostname::VARCHAR[])     as vm_hostname,
+            unnest($vm_ip::VARCHAR[])           as vm_ip,
+            unnest($sup_behavior::VARCHAR[])    as sup_behavior,
+            unnest($sup_flavor::VARCHAR[])      as sup_flavor
+    """, file_columns)
 
     # Get max existing ID
     try:
@@ -409,124 +588,209 @@ def load_events_to_duckdb(
     except Exception:
         event_id = 0
 
-    for experiment in experiments:
-        exp_dir = raw_dir / experiment
-        if not exp_dir.exists():
-            continue
-
-        for vm_dir in sorted(exp_dir.iterdir()):
-            if not vm_dir.is_dir():
-                continue
-
-            jsonl_files = sorted([
-                str(f) for f in vm_dir.glob("*.jsonl")
-                if not f.is_symlink() and f.name != "latest.jsonl"
-            ])
-            if not jsonl_files:
-                continue
+    # File list, timestamp and ID offset are bound as parameters, not spliced
+    # into the SQL, so paths need no quote-escaping.
+    query = """
+        INSERT INTO events
+        SELECT
+            ROW_NUMBER() OVER () + $event_id as id,
+            TRY_CAST(r.timestamp AS TIMESTAMP) as timestamp,
+            r.session_id,
+            r.agent_type,
+            r.event_type,
+            r.workflow,
+            r.details,
+            m.experiment_name,
+            m.vm_hostname,
+            m.vm_ip,
+            m.sup_behavior,
+            m.sup_flavor,
+            NULL as source_file,
+            $collection_ts::TIMESTAMP as collection_timestamp,
+            TRY_CAST(r.d.duration_ms AS INTEGER) as duration_ms,
+            TRY_CAST(r.d.success AS BOOLEAN) as success,
+            COALESCE(r.d.error, r.d.message) as error_message,
+            r.d.model as model,
+            r.d.action as action,
+            r.d.category as category,
+            r.d.step_name as step_name,
+            r.d.status as status,
+            TRY_CAST(r.d.tokens.input AS INTEGER) as input_tokens,
+            TRY_CAST(r.d.tokens.output AS INTEGER) as output_tokens,
+            TRY_CAST(r.d.tokens.total AS INTEGER) as total_tokens,
+            r.d.output as llm_output
+        FROM (
+            SELECT
+                *,
+                -- Parse details once into a struct of the extracted fields,
+                -- rather than re-parsing the document per json_extract_string.
+                from_json(details, '{
+                    "duration_ms": "VARCHAR",
+                    "success": "VARCHAR",
+                    "error": "VARCHAR",
+                    "message": "VARCHAR",
+                    "model": "VARCHAR",
+                    "action": "VARCHAR",
+                    "category": "VARCHAR",
+                    "step_name": "VARCHAR",
+                    "status": "VARCHAR",
+                    "tokens": {"input": "VARCHAR", "output": "VARCHAR", "total": "VARCHAR"},
+                    "output": "VARCHAR"
+                }') as d
+            FROM read_json(
+                $files,
+                format='newline_delimited',
+                columns={
+                    timestamp: 'VARCHAR',
+                    session_id: 'VARCHAR',
+                    agent_type: 'VARCHAR',
+                    event_type: 'VARCHAR',
+                    workflow: 'VARCHAR',
+                    details: 'JSON'
+                },
+                ignore_errors=true,
+                filename=true
+            )
+        ) r
+        JOIN file_meta m USING (filename)
+        -- ignore_errors=true turns an unparseable line into an all-NULL row
+        -- rather than dropping it; keep those out of events.
+        WHERE NOT (r.timestamp IS NULL AND r.session_id IS NULL
+                   AND r.event_type IS NULL AND r.details IS NULL)
+        -- Cluster rows so each row group's zonemap covers a narrow range of
+        -- experiment / behavior / time, which is what the analyses filter on.
+        ORDER BY m.experiment_name, m.sup_behavior, timestamp
+    """
 
-            vm_key = f"{experiment}:{vm_dir.name}"
-            vm = vm_info_map.get(vm_key)
-            vm_ip = (vm.ip if vm else "").replace("'", "''")
-            sup_behavior = (vm.sup_behavior if vm else "").replace("'", "''")
-            sup_flavor = (vm.sup_flavor if vm else "").replace("'", "''")
-            vm_hostname = vm_dir.name.replace("'", "''")
-            exp_escaped = experiment.replace("'", "''")
-
-            file_list_sql = ", ".join(f"'{f}'" for f in jsonl_files)
-
-            query = f"""
-                INSERT INTO events
-                SELECT
-                    ROW_NUMBER() OVER () + {event_id} as id,
-                    TRY_CAST(timestamp AS TIMESTAMP) as timestamp,
-                    session_id,
-                    agent_type,
-                    event_type,
-                    workflow,
-                    details,
-                    '{exp_escaped}' as experiment_name,
-                    '{vm_hostname}' as vm_hostname,
-                    '{vm_ip}' as vm_ip,
-                    '{sup_behavior}' as sup_behavior,
-                    '{sup_flavor}' as sup_flavor,
-                    NULL as source_file,
-                    '{collection_ts}'::TIMESTAMP as collection_timestamp,
-                    TRY_CAST(json_extract_string(details, '$.duration_ms') AS INTEGER) as duration_ms,
-                    TRY_CAST(json_extract_string(details, '$.success') AS BOOLEAN) as success,
-                    COALESCE(
-                        json_extract_string(details, '$.error'),
-                        json_extract_string(details, '$.message')
-                    ) as error_message,
-                    json_extract_string(details, '$.model') as model,
-                    json_extract_string(details, '$.action') as action,
-                    json_extract_string(details, '$.category') as category,
-                    json_extract_string(details, '$.step_name') as step_name,
-                    json_extract_string(details, '$.status') as status,
-                    TRY_CAST(json_extract_string(details, '$.tokens.input') AS INTEGER) as input_tokens,
-                    TRY_CAST(json_extract_string(details, '$.tokens.output') AS INTEGER) as output_tokens,
-                    TRY_CAST(json_extract_string(details, '$.tokens.total') AS INTEGER) as total_tokens,
-                    json_extract_string(details, '$.output') as llm_output
-                FROM read_json(
-                    [{file_list_sql}],
-                    format='newline_delimited',
-                    columns={{
-                        timestamp: 'VARCHAR',
-                        session_id: 'VARCHAR',
-                        agent_type: 'VARCHAR',
-                        event_type: 'VARCHAR',
-                        workflow: 'VARCHAR',
-                        details: 'JSON'
-                    }},
-                    ignore_errors=true
-                )
-            """
-
-            before = conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
-            conn.execute(query)
-            after = conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
-            loaded = after - before
-            event_id += loaded
-            total_loaded += loaded
-
-            if loaded > 0 and not _CHILD_MODE:
-                print(f"    {vm_dir.name}: {loaded:,} events")
+    # INSERT returns its own row count — no need to re-scan events
+    total_loaded = conn.execute(query, {
+        "event_id": event_id,
+        "collection_ts": collection_ts,
+        "files": file_columns["filename"],
+    }).fetchone()[0]
 
     if not _CHILD_MODE:
-        print(f"  Total: {total_loaded:,} events")
+        print(f"  Total: {total_loaded:,} events from {len(file_meta)} files")
     return total_loaded
 
 
+def copy_database(src: Path, dst: Path, sync: bool = False) -> None:
+    """Copy a DuckDB file between local disk and NFS with sequential readahead.
+
+    Tries copy_file_range first, which copies in-kernel with no userspace
+    bounce buffer. Where the kernel refuses it (e.g. EXDEV across filesystem
+    types), the rest goes through NFS_IO_BUFSIZE transfers instead of
+    copyfileobj's 64 KiB default. With sync, dst is fsynced before closing.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fsrc.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        size = os.fstat(fsrc.fileno()).st_size
+        copied = 0
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while copied < size:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+        fsrc.seek(copied)
+        fdst.seek(copied)
+        shutil.copyfileobj(fsrc, fdst, NFS_IO_BUFSIZE)
+        if sync:
+            fdst.flush()
+            os.fsync(fdst.fileno())
+
+
+def publish_database(src: Path, dst: Path) -> None:
+    """Move the locally built database to its final path.
+
+    A rename when both are on the same filesystem. Otherwise the build is
+    copied to a temporary name next to dst and renamed over it, so the
+    existing database is never left half-written and readers never see a
+    partial file. The local build is removed afterwards.
+    """
+    try:
+        os.replace(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    # The data is fsynced before the rename, and the directory after it, so a
+    # crash can't leave dst pointing at a file whose contents never landed.
+    # The staging name is unique per run and can't collide with DuckDB's
+    # default spill directory for dst ("<db>.tmp").
+    fd, tmp_name = tempfile.mkstemp(dir=dst.parent, prefix=f".{dst.name}.", suffix=".part")
+    os.close(fd)
+    tmp = Path(tmp_name)
+    try:
+        shutil.copymode(src, tmp)  # mkstemp creates 0600; keep it readable
+        copy_database(src, tmp, sync=True)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    dir_fd = os.open(dst.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+    src.unlink()
+
+
 def create_analysis_views(conn: duckdb.DuckDBPyConnection):
-    """Create analysis views for querying."""
+    """Create analysis views and aggregate tables for querying."""
 
     if not _CHILD_MODE:
         print("  Creating analysis views...")
 
-    conn.execute("""
+    # llm_performance and session_summary are materialized: they scan all of
+    # events, and the database is rebuilt on every collection, so there is
+    # nothing to keep in sync. Databases from before that change hold them as
+    # views, which CREATE OR REPLACE TABLE cannot replace.
+    for (name,) in conn.execute("""
+        SELECT view_name FROM duckdb_views()
+        WHERE view_name IN ('llm_performance', 'session_summary')
+    """).fetchall():
+        conn.execute(f"DROP VIEW {name}")
+
+    # Categorize each distinct workflow string once into a small lookup table,
+    # so queries on workflow_analysis only pay for a join, not the keyword
+    # regexes. Rebuilt on every load, so appended workflows are picked up.
+    category_cases = "\n".join(
+        f"                WHEN regexp_matches(wf, '{'|'.join(keywords)}') THEN '{category}'"
+        for category, keywords in WORKFLOW_CATEGORIES
+    )
+
+    # Everything else goes to DuckDB as one script: a single call, parsed in
+    # one pass, inside the load transaction the caller holds open.
+    conn.execute(f"""
+        CREATE OR REPLACE TABLE workflow_categories AS
+        SELECT
+            workflow,
+            CASE
+{category_cases}
+                ELSE 'other'
+            END as workflow_category
+        FROM (
+            SELECT DISTINCT workflow, lower(workflow) as wf
+            FROM events
+            WHERE workflow IS NOT NULL
+        );
+
         CREATE OR REPLACE VIEW workflow_analysis AS
         SELECT
             id, timestamp, session_id, agent_type, event_type, workflow,
             details, experiment_name, vm_hostname, sup_behavior, sup_flavor,
             duration_ms, success, error_message, model,
-            CASE
-                WHEN lower(workflow) LIKE '%search%' OR lower(workflow) LIKE '%google%' THEN 'web_search'
-                WHEN lower(workflow) LIKE '%youtube%' OR lower(workflow) LIKE '%video%' THEN 'youtube'
-                WHEN lower(workflow) LIKE '%download%' OR lower(workflow) LIKE '%file%' THEN 'file_ops'
-                WHEN lower(workflow) LIKE '%command%' OR lower(workflow) LIKE '%shell%' THEN 'shell'
-                WHEN lower(workflow) LIKE '%document%' OR lower(workflow) LIKE '%writer%'
-                     OR lower(workflow) LIKE '%spreadsheet%' THEN 'document'
-                WHEN lower(workflow) LIKE '%weather%' OR lower(workflow) LIKE '%explain%'
-                     OR lower(workflow) LIKE '%what is%' THEN 'research'
-                WHEN lower(workflow) LIKE '%browse%' OR lower(workflow) LIKE '%visit%'
-                     OR lower(workflow) LIKE '%wikipedia%' THEN 'web_browse'
-                ELSE 'other'
-            END as workflow_category
+            workflow_category
         FROM events
-        WHERE workflow IS NOT NULL
-    """)
+        JOIN workflow_categories USING (workflow);
 
-    conn.execute("""
         CREATE OR REPLACE VIEW llm_analysis AS
         SELECT
             id, timestamp, session_id, agent_type, event_type, workflow,
@@ -539,11 +803,9 @@ def create_analysis_views(conn: duckdb.DuckDBPyConnection):
                 ELSE NULL
             END as tokens_per_second
         FROM events
-        WHERE event_type IN ('llm_request', 'llm_response', 'llm_error')
-    """)
+        WHERE event_type IN ('llm_request', 'llm_response', 'llm_error');
 
-    conn.execute("""
-        CREATE OR REPLACE VIEW llm_performance AS
+        CREATE OR REPLACE TABLE llm_performance AS
         SELECT
             experiment_name,
             sup_behavior,
@@ -564,11 +826,9 @@ def create_analysis_views(conn: duckdb.DuckDBPyConnection):
             ) FILTER (WHERE event_type = 'llm_response'), 2) as avg_tokens_per_second
         FROM events
         WHERE event_type IN ('llm_request', 'llm_response', 'llm_error')
-        GROUP BY experiment_name, sup_behavior, model
-    """)
+        GROUP BY experiment_name, sup_behavior, model;
 
-    conn.execute("""
-        CREATE OR REPLACE VIEW session_summary AS
+        CREATE OR REPLACE TABLE session_summary AS
         SELECT
             session_id,
             experiment_name,
@@ -623,12 +883,17 @@ def write_manifest(
             "ip": result.vm.ip,
             "sup_behavior": result.vm.sup_behavior,
             "events_collected": result.events_collected,
+            "unchanged": result.unchanged,
             "success": result.success,
             "errors": result.errors
         })
 
-    with open(manifest_path, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    if orjson is not None:
+        with open(manifest_path, 'wb') as f:
+            f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    else:
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
 
 
 # ============================================================================
@@ -778,12 +1043,6 @@ Examples:
         if db_path.exists():
             print(f"  Status: EXISTS ({'will rebuild' if rebuild else 'will append'})")
 
-    # Clean existing DB if rebuilding
-    if rebuild and not args.dry_run:
-        for p in (db_path, manifest_path):
-            if p.exists():
-                p.unlink()
-
     if not args.dry_run:
         BASE_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         raw_dir.mkdir(parents=True, exist_ok=True)
@@ -794,22 +1053,24 @@ Examples:
 
     _section("Collecting JSONL logs from VMs")
 
+    # Parse every inventory first, then run all (experiment, VM) pairs through
+    # one pool so --parallel is a global cap and experiments overlap.
+    work: List[Tuple[str, VMInfo]] = []
     for deploy_name, run_id, inv_path in resolved:
         tag = f"{deploy_name}-{run_id}" if run_id else deploy_name
         vms = parse_inventory(inv_path)
 
         _out(f"[{tag}] Found {len(vms)} VMs")
 
-        if not vms:
-            continue
-
         for vm in vms:
             vm_info_map[f"{tag}:{vm.hostname}"] = vm
+            work.append((tag, vm))
 
+    try:
         with ThreadPoolExecutor(max_workers=args.parallel) as executor:
             futures = {
                 executor.submit(collect_logs_from_vm, vm, tag, raw_dir, args.dry_run): vm
-                for vm in vms
+                for tag, vm in work
             }
 
             for future in as_completed(futures):
@@ -818,11 +1079,15 @@ Examples:
 
                 status = "OK" if result.success else "FAILED"
                 events_str = f"{result.events_collected:,} events" if result.events_collected else "no JSONL"
-                _out(f"  {result.vm.hostname}: {status} ({events_str})")
+                if result.unchanged:
+                    events_str += ", unchanged"
+                _out(f"  [{result.experiment}] {result.vm.hostname}: {status} ({events_str})")
 
                 if result.errors:
                     for err in result.errors:
                         _out(f"    ERROR: {err}")
+    finally:
+        close_control_masters(list(vm_info_map.values()))
 
     # Summary
     total_events_collected = sum(r.events_collected for r in all_results)
@@ -848,24 +1113,46 @@ Examples:
         print("\n[--skip-load] Skipping DuckDB loading.")
         return 0
 
-    # Load into DuckDB (directly on NFS)
+    # Load into DuckDB on local disk, then copy to NFS. DuckDB's random writes
+    # and temp-file churn are slow on NFS; one sequential copy is not.
     _section("Loading into DuckDB")
 
-    conn = init_database(db_path)
-
-    # Build experiment tags for loading
-    exp_tags = [f"{d}-{r}" if r else d for d, r, _ in resolved]
-
-    if not _CHILD_MODE:
-        print(f"\n  Loading JSONL events...")
-    total_events = load_events_to_duckdb(conn, raw_dir, exp_tags, vm_info_map)
-    _out(f"  Events loaded: {total_events:,}")
-
-    create_analysis_views(conn)
-    conn.close()
-
-    # Write manifest
-    write_manifest(manifest_path, all_results, collection_date, total_events)
+    # Each run builds in its own directory, so concurrent runs never share
+    # a DB, WAL or spill file even when they target the same db_name.
+    build_dir = Path(tempfile.mkdtemp(prefix="sup_logs_", dir=LOCAL_BUILD_DIR))
+    local_db_path = build_dir / db_name
+    try:
+        if not rebuild and db_path.exists():
+            copy_database(db_path, local_db_path)
+
+        conn = init_database(local_db_path)
+
+        # Build experiment tags for loading
+        exp_tags = [f"{d}-{r}" if r else d for d, r, _ in resolved]
+
+        # Load and views commit as one transaction, then a single checkpoint
+        # writes everything into the file before it is copied to NFS.
+        conn.execute("BEGIN TRANSACTION")
+        if not _CHILD_MODE:
+            print(f"\n  Loading JSONL events...")
+        total_events = load_events_to_duckdb(conn, raw_dir, exp_tags, vm_info_map)
+        _out(f"  Events loaded: {total_events:,}")
+
+        create_analysis_views(conn)
+        conn.execute("COMMIT")
+        conn.execute("CHECKPOINT")
+        conn.close()
+
+        # Overlap the NFS copy of the database with writing the manifest
+        with ThreadPoolExecutor(max_workers=2) as io_pool:
+            copy_future = io_pool.submit(publish_database, local_db_path, db_path)
+            manifest_future = io_pool.submit(
+                write_manifest, manifest_path, all_results, collection_date, total_events
+            )
+            copy_future.result()
+            manifest_future.result()
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
 
     # Final summary
     if _CHILD_MODE:
@@ -875,7 +1162,7 @@ Examples:
         print(f"  Database: {db_path}")
         print(f"  Events: {total_events:,}")
         print(f"  Manifest: {manifest_path}")
-        print(f"\nViews available:")
+        print(f"\nViews and tables available:")
         print(f"  workflow_analysis  - Workflows with categories")
         print(f"  llm_analysis       - LLM events with tokens/sec")
         print(f"  llm_performance    - Aggregate LLM metrics by model/SUP")